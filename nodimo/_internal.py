@@ -27,6 +27,10 @@ _unsympify_number(number)
     Does the inverse of _sympify_number.
 _prettify_name(name, bold=True)
     Wrapper for the Sympy function pretty_symbol.
+_matrix_rank_and_pivots(matrix)
+    Computes the rank and pivot columns of a matrix.
+_matrix_rref(matrix)
+    Computes the reduced row echelon form of a Sympy matrix.
 _show_nodimo_warning(message)
     Displays a NodimoWarning message with custom format.
 
@@ -36,23 +40,44 @@ NodimoWarning
     (Custom) Nodimo warning
 """
 
-from sympy import pretty, Number, Rational, nsimplify, sympify
+from sympy import (
+    pretty,
+    Number,
+    Rational,
+    Matrix,
+    ImmutableDenseMatrix,
+    QQ,
+    nsimplify,
+    sympify,
+)
 from sympy.printing.pretty.pretty_symbology import pretty_symbol
+from functools import lru_cache
+from math import gcd, lcm
 from typing import Union
 import warnings
 
+try:
+    from sympy.polys.matrices import DomainMatrix
+except ImportError:
+    DomainMatrix = None
+
+# In older versions of sympy, DomainMatrix is either not available or
+# can not be created from a Sympy matrix.
+if DomainMatrix is not None and not hasattr(DomainMatrix, 'from_Matrix'):
+    DomainMatrix = None
+
 
 # Determine if Nodimo is running on IPython/Jupyter.
 try:
     from IPython import get_ipython
 
-    _is_running_on_jupyter = True if get_ipython() is not None else False
-    if not _is_running_on_jupyter:
-        raise
-    from IPython.display import display, Markdown, HTML
-except:
+    _is_running_on_jupyter = get_ipython() is not None
+except ImportError:
     _is_running_on_jupyter = False
 
+if _is_running_on_jupyter:
+    from IPython.display import display, Markdown, HTML
+
 
 def _custom_display(obj):
     """Displays object using a custom CSS style.
@@ -229,6 +254,129 @@ def _prettify_name(name: str, bold: bool = False):
         raise ValueError(f"{repr(name)} is an invalid name")
 
 
+def _matrix_rank_and_pivots(
+    matrix: Union[list[list], tuple[tuple, ...]]
+) -> tuple[int, tuple[int, ...]]:
+    """Computes the rank and pivot columns of a matrix.
+
+    For rational matrices, each row is scaled to integers and Gaussian
+    elimination is performed fraction-free with plain integers, which is
+    much faster than the symbolic elimination done by Sympy matrices.
+    Matrices with non-rational elements fall back to Sympy's ``rref``.
+    The pivot columns are the same in both cases.
+
+    Results are cached by matrix content, since the same dimensional
+    matrices are built repeatedly when creating models.
+
+    Parameters
+    ----------
+    matrix : Union[list[list], tuple[tuple]]
+        Matrix given as a sequence of rows.
+
+    Returns
+    -------
+    rank : int
+        The rank of the matrix.
+    pivots : tuple[int]
+        Indexes of the pivot columns.
+    """
+
+    return _cached_matrix_rank_and_pivots(tuple(tuple(row) for row in matrix))
+
+
+@lru_cache(maxsize=512)
+def _cached_matrix_rank_and_pivots(
+    matrix: tuple[tuple, ...]
+) -> tuple[int, tuple[int, ...]]:
+    """Cached implementation of _matrix_rank_and_pivots."""
+
+    rows = []
+    for row in matrix:
+        rational_row = []
+        for element in row:
+            number = sympify(element)
+            if not number.is_Rational:
+                _, pivots = Matrix(matrix).rref()
+                return len(pivots), tuple(pivots)
+            rational_row.append(number)
+        # Scaling a row changes neither the rank nor the pivot columns,
+        # so rational rows are turned into integer rows.
+        multiplier = lcm(*(int(number.q) for number in rational_row))
+        rows.append([int(number * multiplier) for number in rational_row])
+
+    return _integer_rank_and_pivots(rows)
+
+
+def _integer_rank_and_pivots(rows: list[list[int]]) -> tuple[int, tuple[int, ...]]:
+    """Fraction-free Gaussian elimination of a matrix with int elements.
+
+    Rows are combined by cross-multiplication and then divided by the
+    greatest common divisor of their elements, which keeps the numbers
+    small without ever leaving the integers.
+    """
+
+    nrows = len(rows)
+    ncols = len(rows[0]) if nrows > 0 else 0
+    rank = 0
+    pivots = []
+    for j in range(ncols):
+        if rank == nrows:
+            break
+        for i in range(rank, nrows):
+            if rows[i][j] != 0:
+                rows[rank], rows[i] = rows[i], rows[rank]
+                break
+        else:
+            continue
+
+        pivot_row = rows[rank]
+        pivot = pivot_row[j]
+        for i in range(rank + 1, nrows):
+            factor = rows[i][j]
+            if factor != 0:
+                row = [pivot * a - factor * b for a, b in zip(rows[i], pivot_row)]
+                divisor = gcd(*row)
+                if divisor > 1:
+                    row = [a // divisor for a in row]
+                rows[i] = row
+
+        pivots.append(j)
+        rank += 1
+
+    return rank, tuple(pivots)
+
+
+def _matrix_rref(matrix: Matrix) -> tuple[ImmutableDenseMatrix, tuple[int, ...]]:
+    """Computes the reduced row echelon form of a Sympy matrix.
+
+    Rational matrices are reduced with Sympy's DomainMatrix over the
+    rationals, which avoids the symbolic arithmetic of Sympy matrices.
+    Other matrices, or older versions of Sympy, use ``Matrix.rref``.
+
+    Parameters
+    ----------
+    matrix : Matrix
+        The matrix to be reduced.
+
+    Returns
+    -------
+    rref : ImmutableDenseMatrix
+        The reduced row echelon form of the matrix.
+    pivots : tuple[int]
+        Indexes of the pivot columns.
+    """
+
+    if DomainMatrix is not None:
+        domain_matrix = DomainMatrix.from_Matrix(matrix)
+        if domain_matrix.domain.is_ZZ or domain_matrix.domain.is_QQ:
+            rref, pivots = domain_matrix.convert_to(QQ).rref()
+            return ImmutableDenseMatrix(rref.to_Matrix()), tuple(pivots)
+
+    rref, pivots = matrix.rref()
+
+    return ImmutableDenseMatrix(rref), tuple(pivots)
+
+
 class NodimoWarning(Warning):
     """(Custom) Nodimo warning.
 
@@ -15,12 +15,19 @@ Collection
     Creates a collection of quantities.
 """
 
-from sympy import sstr, latex, S, Number, Matrix, ImmutableDenseMatrix, eye
+from sympy import srepr, sstr, latex, S, Number, Matrix, ImmutableDenseMatrix, eye
 from sympy.printing.pretty.stringpict import prettyForm
+from typing import Optional
 
 from nodimo.dimension import Dimension
 from nodimo.quantity import Quantity, Constant, One
-from nodimo._internal import _show_object, _show_nodimo_warning
+from nodimo._internal import (
+    _show_object,
+    _show_nodimo_warning,
+    _unsympify_number,
+    _matrix_rank_and_pivots,
+    _matrix_rref,
+)
 
 
 class Collection:
@@ -53,8 +60,11 @@ class Collection:
     """
 
     def __init__(self, *quantities: Quantity):
-        self._quantities: list[Quantity]
-        self._dimensions: dict[str, Number]
+        self._quantities_list: list[Quantity]
+        self._quantities_set: Optional[frozenset[Quantity]]
+        self._quantities_repr: Optional[str]
+        self._dimensions_dict: dict[str, Number]
+        self._dimensions_repr: Optional[str]
         self._is_dimensionless: bool
 
         self._disassembled_quantities: list[Quantity]
@@ -69,12 +79,12 @@ class Collection:
         self._dependent_quantities: list[Quantity]
         self._independent_quantities: list[Quantity]
 
-        self._raw_matrix: list[list[Number]]
-        self._matrix: ImmutableDenseMatrix
+        self._raw_matrix: tuple[tuple[Number, ...], ...]
+        self._sympy_matrix: Optional[ImmutableDenseMatrix]
         self._rank: int
         self._rcef: ImmutableDenseMatrix
         self._independent_rows: tuple[int]
-        self._submatrices: dict[Quantity, ImmutableDenseMatrix]
+        self._submatrices: dict[Quantity, int]
 
         self._set_collection_quantities(*quantities)
         self._set_collection()
@@ -85,6 +95,34 @@ class Collection:
     def quantities(self) -> list[Quantity]:
         return self._quantities
 
+    @property
+    def _quantities(self) -> list[Quantity]:
+        return self._quantities_list
+
+    @_quantities.setter
+    def _quantities(self, quantities: list[Quantity]):
+        self._quantities_list = quantities
+        self._quantities_set = None
+        self._quantities_repr = None
+
+    @property
+    def _dimensions(self) -> dict[str, Number]:
+        return self._dimensions_dict
+
+    @_dimensions.setter
+    def _dimensions(self, dimensions: dict[str, Number]):
+        self._dimensions_dict = dimensions
+        self._dimensions_repr = None
+
+    @property
+    def _matrix(self) -> ImmutableDenseMatrix:
+        """Sympy dimensional matrix, built from the raw matrix on demand."""
+
+        if self._sympy_matrix is None:
+            self._sympy_matrix = ImmutableDenseMatrix(self._raw_matrix)
+
+        return self._sympy_matrix
+
     def show(self, use_custom_css: bool = True, use_unicode: bool = True):
         _show_object(self, use_custom_css=use_custom_css, use_unicode=use_unicode)
 
@@ -107,12 +145,13 @@ class Collection:
         self._set_base_quantities()
 
     def _validate_collection(self):
-        repeated_names = []
-        for i, qty1 in enumerate(self._base_quantities):
-            for qty2 in list(self._base_quantities)[i + 1 :]:
-                repname = qty1.name if qty1.name == qty2.name else None
-                if repname is not None and repname not in repeated_names:
-                    repeated_names.append(repname)
+        # Base quantities are unique, so a name counted more than once
+        # belongs to different quantities.
+        names_count = {}
+        for qty in self._base_quantities:
+            names_count[qty.name] = names_count.get(qty.name, 0) + 1
+
+        repeated_names = [name for name, count in names_count.items() if count > 1]
 
         if len(repeated_names) > 0:
             raise ValueError(
@@ -127,26 +166,29 @@ class Collection:
         which the exponent value is preserved.
         """
 
+        # Dimensions and their exponents are gathered in a single pass,
+        # counting how many quantities share each dimension.
         dimensions = {}
+        dimensions_count = {}
         for qty in self._quantities:
-            for dim in qty.dimension:
+            for dim, exp in qty.dimension.items():
                 if dim not in dimensions:
-                    dimensions[dim] = S.NaN
-
-        for dim in dimensions:
-            same_dim = []
-            for i, qty in enumerate(self._quantities):
-                if dim not in qty.dimension:
-                    same_dim.append(False)
-                    break
-                if i > 0:
-                    same_dim.append(qty.dimension[dim] == qty_ref.dimension[dim])
-                qty_ref = qty
-            if all(same_dim):
-                dimensions[dim] = qty_ref.dimension[dim]
+                    dimensions[dim] = exp
+                    dimensions_count[dim] = 1
+                else:
+                    dimensions_count[dim] += 1
+                    if dimensions[dim] != exp:
+                        dimensions[dim] = S.NaN
+
+        nqts = len(self._quantities)
+        for dim, count in dimensions_count.items():
+            if count < nqts:
+                dimensions[dim] = S.NaN
 
         self._dimensions = dimensions
-        self._is_dimensionless = all(dim == 0 for dim in dimensions.values())
+        # Quantities carry no null exponents, so the collection is only
+        # dimensionless when no dimensions were gathered.
+        self._is_dimensionless = not dimensions
 
     def _set_dimensions(self, **dimensions: Number):
         """Reserved for subclasses that need dimensions setting."""
@@ -190,11 +232,11 @@ class Collection:
         """
 
         if only_numbers:
-            constants = self._number_constants
+            constants = frozenset(self._number_constants)
         elif only_ones:
-            constants = [One()]
+            constants = frozenset([One()])
         else:
-            constants = self._constants
+            constants = frozenset(self._constants)
 
         clear_quantities = []
         for qty in self._quantities:
@@ -225,30 +267,28 @@ class Collection:
     def _set_base_quantities(self):
         """Determines all nonnumerical instances of Quantity."""
 
-        base_quantities = []
+        # Dictionary keys are used as an insertion-ordered set.
+        base_quantities = {}
         for qty in self._disassembled_quantities:
             if qty._is_power:
                 base_qty = qty.base
             else:
                 base_qty = qty
 
-            if not base_qty._symbolic.is_number and base_qty not in base_quantities:
-                base_quantities.append(base_qty)
+            if not base_qty._symbolic.is_number:
+                base_quantities[base_qty] = None
 
         self._base_quantities = list(base_quantities)
 
     def _set_constants(self):
         """Determines all nonrepetitive instances of Constant."""
 
-        number_constants = []
-        constants = []
+        constants = {}
         for qty in self._quantities:
-            if qty._is_constant and qty not in constants:
-                if qty._is_number:
-                    number_constants.append(qty)
-                constants.append(qty)
+            if qty._is_constant:
+                constants[qty] = None
 
-        self._number_constants = list(number_constants)
+        self._number_constants = [qty for qty in constants if qty._is_number]
         self._constants = list(constants)
 
     def _set_scaling_quantities(self):
@@ -280,26 +320,47 @@ class Collection:
         self._independent_quantities = list(independent_quantities)
 
     def _set_matrix(self):
-        """Builds basic dimensional matrix."""
+        """Builds basic dimensional matrix.
 
-        raw_matrix = []
-        for dim in self._dimensions:
-            dim_exponents = []
-            for qty in self._quantities:
-                if dim in qty.dimension:
-                    dim_exponents.append(qty.dimension[dim])
-                else:
-                    dim_exponents.append(S.Zero)
-            raw_matrix.append(dim_exponents)
+        Only the raw matrix (tuple of rows) is built here. The Sympy
+        matrix is created on first access to ``_matrix``.
+        """
 
+        dimensions = self._dimensions.keys()
+        if all(qty.dimension.keys() == dimensions for qty in self._quantities):
+            # Quantities often share the same dimensions, in which case
+            # the exponents are read directly.
+            raw_matrix = tuple(
+                tuple(qty.dimension[dim] for qty in self._quantities)
+                for dim in dimensions
+            )
+        else:
+            # The matrix is preallocated with zeros and only the exponents
+            # of each quantity's dimensions are filled in.
+            dimensions_index = {dim: i for i, dim in enumerate(dimensions)}
+            ncols = len(self._quantities)
+            raw_matrix = [[0] * ncols for _ in dimensions_index]
+            for j, qty in enumerate(self._quantities):
+                for dim, exp in qty.dimension.items():
+                    i = dimensions_index.get(dim)
+                    if i is not None:
+                        raw_matrix[i][j] = exp
+            raw_matrix = tuple(tuple(row) for row in raw_matrix)
+
+        # The raw matrix is frozen, so it can be hashed by the rank cache.
         self._raw_matrix = raw_matrix
-        self._matrix = ImmutableDenseMatrix(raw_matrix)
+        self._sympy_matrix = None
 
     def _set_matrix_rank(self):
-        if not hasattr(self, '_matrix'):
+        if not hasattr(self, '_raw_matrix'):
             self._set_matrix()
 
-        self._rank = self._matrix.rank()
+        # The rank is the same for the matrix and its transpose, so the
+        # orientation with fewer rows, which is eliminated faster, is used.
+        if len(self._dimensions) <= len(self._quantities):
+            self._rank, _ = _matrix_rank_and_pivots(self._raw_matrix)
+        else:
+            self._rank, _ = _matrix_rank_and_pivots(tuple(zip(*self._raw_matrix)))
 
     def _set_matrix_independent_rows(self):
         """Independent rows are also independent dimensions.
@@ -308,13 +369,13 @@ class Collection:
         the user, specially when the dimensions are not all independent.
         """
 
-        if not hasattr(self, '_rank'):
-            self._set_matrix_rank()
+        self._set_matrix_rank()
 
         if len(self._dimensions) > self._rank and len(self._quantities) > self._rank:
             # In case the number of dimensions is larger than the rank,
-            # the dimensions are not all independent.
-            rref, independent_rows = self._matrix.T.rref()
+            # the dimensions are not all independent. The independent
+            # rows are the pivot columns of the transposed matrix.
+            rref, independent_rows = _matrix_rref(self._matrix.T)
             rcef = rref.T[:, : len(self._dimensions)]
             exponents = rcef @ Matrix(list(self._dimensions.values()))
             dimensions = dict(zip(self._dimensions, exponents[:]))
@@ -341,16 +402,12 @@ class Collection:
         self._independent_dimensions = independent_dimensions
 
     def _set_submatrices(self):
-        """Builds one column matrix for each quantity."""
+        """Maps each quantity to its column in the dimensional matrix."""
 
-        if not hasattr(self, '_matrix'):
+        if not hasattr(self, '_raw_matrix'):
             self._set_matrix()
 
-        submatrices = []
-        for i, qty in enumerate(self._quantities):
-            submatrices.append((qty, self._matrix.col(i)))
-
-        self._submatrices = dict(submatrices)
+        self._submatrices = {qty: i for i, qty in enumerate(self._quantities)}
 
     def _get_submatrix(self, *quantities) -> ImmutableDenseMatrix:
         """Combines the quantities' submatrices into one submatrix.
@@ -371,18 +428,72 @@ class Collection:
             If the given quantities are not all part of the collection.
         """
 
-        if not set(quantities).issubset(set(self._quantities)):
+        if not self._get_quantities_set().issuperset(quantities):
             raise ValueError(f"'{quantities}' is not a subset of '{self._quantities}'")
         elif not hasattr(self, '_submatrices'):
             self._set_submatrices()
 
-        submatrices = [self._submatrices[qty] for qty in quantities]
-        submatrix = ImmutableDenseMatrix.hstack(*submatrices)
+        if quantities == tuple(self._quantities) and len(self._raw_matrix) > 0:
+            # All quantities in the original order give the matrix itself.
+            return self._matrix
+
+        # The submatrix is built at once from the raw matrix columns.
+        columns = [self._submatrices[qty] for qty in quantities]
+        submatrix = ImmutableDenseMatrix(
+            len(self._raw_matrix),
+            len(columns),
+            [row[j] for row in self._raw_matrix for j in columns],
+        )
 
         return submatrix
 
+    def _get_quantities_set(self) -> frozenset[Quantity]:
+        """Frozen set of quantities, cached until quantities change."""
+
+        if self._quantities_set is None:
+            self._quantities_set = frozenset(self._quantities)
+
+        return self._quantities_set
+
+    def _get_quantities_repr(self) -> str:
+        """Developer representation of the (unreduced) quantities.
+
+        The representation is built with ``srepr``, so it does not depend
+        on the calling printer, and it is cached until quantities change.
+        """
+
+        if self._quantities_repr is None:
+            self._quantities_repr = ', '.join(
+                srepr(qty._unreduced) for qty in self._quantities
+            )
+
+        return self._quantities_repr
+
+    def _get_dimensions_repr(self) -> str:
+        """Developer representation of the dimensions as keywords.
+
+        Returns an empty string for dimensionless collections, otherwise
+        the keywords are preceded by a comma, e.g. ``", M=1, L=-1"``.
+        The representation is cached until dimensions change.
+        """
+
+        if self._is_dimensionless:
+            return ''
+
+        if self._dimensions_repr is None:
+            dims = []
+            for dim_name, dim_exp in self._dimensions.items():
+                dim_exp_ = _unsympify_number(dim_exp)
+                if isinstance(dim_exp_, str):
+                    dims.append(f"{dim_name}='{dim_exp_}'")
+                else:
+                    dims.append(f'{dim_name}={dim_exp_}')
+            self._dimensions_repr = f", {', '.join(dims)}"
+
+        return self._dimensions_repr
+
     def _key(self) -> tuple:
-        return (frozenset(self._quantities),)
+        return (self._get_quantities_set(),)
 
     def __hash__(self) -> int:
         return hash(self._key())
@@ -395,7 +506,10 @@ class Collection:
         return False
 
     def __contains__(self, item) -> bool:
-        return self._quantities.__contains__(item)
+        if not isinstance(item, Quantity):
+            return False
+
+        return item in self._get_quantities_set()
 
     def __len__(self) -> int:
         return self._quantities.__len__()
@@ -428,9 +542,7 @@ class Collection:
         """Developer string representation according to Sympy."""
 
         class_name = type(self).__name__
-        quantities = ', '.join(
-            printer._print(qty._unreduced) for qty in self._quantities
-        )
+        quantities = self._get_quantities_repr()
 
         return f'{class_name}({quantities})'
 
@@ -52,7 +52,9 @@ class Dimension(dict):
                 dimensions_sp[dim] = exp_sp
 
         self._dimensions = dimensions_sp
-        self._is_dimensionless = all(dim == 0 for dim in dimensions_sp.values())
+        # Null exponents were cleared, so only an empty dimension is
+        # dimensionless.
+        self._is_dimensionless = not dimensions_sp
 
     def _set_symbolic_dimension(self):
         if self._is_dimensionless:
@@ -31,7 +31,7 @@ from nodimo.quantity import Quantity
 from nodimo.collection import Collection
 from nodimo.power import Power
 from nodimo.product import Product
-from nodimo._internal import _unsympify_number, _show_nodimo_warning
+from nodimo._internal import _show_nodimo_warning, _matrix_rank_and_pivots
 
 
 class Group(Collection):
@@ -54,14 +54,14 @@ class Group(Collection):
 
     def _clear_duplicate_quantities(self):
         duplicate_quantities = []
-        clear_quantities = []
+        clear_quantities = {}
         for qty in self._quantities:
             if qty not in clear_quantities:
-                clear_quantities.append(qty)
+                clear_quantities[qty] = None
             else:
                 duplicate_quantities.append(qty._unreduced)
 
-        self._quantities = clear_quantities
+        self._quantities = list(clear_quantities)
 
         if len(duplicate_quantities) > 0:
             _show_nodimo_warning(
@@ -86,30 +86,34 @@ class HomogeneousGroup(Group):
         self._clear_heterogeneous_quantities()
 
     def _clear_heterogeneous_quantities(self):
+        """Removes quantities that are the only ones with a dimension."""
+
+        # Number of quantities that contain each dimension, updated as
+        # quantities are removed.
+        dimensions_count = {}
+        for qty in self._quantities:
+            for dim in qty.dimension:
+                dimensions_count[dim] = dimensions_count.get(dim, 0) + 1
+
         clear_quantities = list(self._quantities)
         irrelevant_quantities = []
-        for _ in self._quantities:
-            irr_qty = None
-            for dim in self._dimensions:
-                dim_bool = []
-                for qty in clear_quantities:
-                    if dim in qty.dimension:
-                        dim_bool.append(True)
-                    else:
-                        dim_bool.append(False)
-
-                dim_count = sum(dim_bool)
-                if dim_count == 1:
-                    irr_qty = clear_quantities[dim_bool.index(True)]
-                    irrelevant_quantities.append(irr_qty._unreduced)
-                    clear_quantities.remove(irr_qty)
-                    self._quantities = clear_quantities
-                    self._set_collection_dimensions()
+        while True:
+            irr_index = None
+            for i, qty in enumerate(clear_quantities):
+                if any(dimensions_count[dim] == 1 for dim in qty.dimension):
+                    irr_index = i
                     break
-            if irr_qty is None:
+            if irr_index is None:
                 break
 
+            irr_qty = clear_quantities.pop(irr_index)
+            irrelevant_quantities.append(irr_qty._unreduced)
+            for dim in irr_qty.dimension:
+                dimensions_count[dim] -= 1
+
         if len(irrelevant_quantities) > 0:
+            self._quantities = clear_quantities
+            self._set_collection_dimensions()
             _show_nodimo_warning(
                 f"Dimensionally irrelevant quantities "
                 f"({str(irrelevant_quantities)[1:-1]})"
@@ -157,9 +161,7 @@ class ScalingGroup(Group):
 
     def _sympyrepr(self, printer) -> str:
         class_name = type(self).__name__
-        quantities = ', '.join(
-            printer._print(qty._unreduced) for qty in self._quantities
-        )
+        quantities = self._get_quantities_repr()
         id_number = f', id_number={self._id_number}' if self._id_number else ''
 
         return f'{class_name}({quantities}{id_number})'
@@ -242,7 +244,7 @@ class IndependentGroup(Group):
         dimensions = {}
         if quantity._is_product:
             for qty in quantity.factors:
-                dimensions = {**dimensions, **self._get_derived_dimensions(qty)}
+                dimensions.update(self._get_derived_dimensions(qty))
         elif quantity._is_power:
             dimensions[quantity.base.name] = quantity.exponent
         elif not quantity._is_constant:
@@ -260,9 +262,10 @@ class IndependentGroup(Group):
 
     def _clear_dependent_derived_quantities(self):
         derived_group = Group(*self._derived_quantities)
-        derived_group._set_matrix_rank()
-        if len(self._derived_quantities) > derived_group._rank:
-            _, indep_qts_indexes = derived_group._matrix.rref()
+        derived_group._set_matrix()
+        rank, pivots = _matrix_rank_and_pivots(derived_group._raw_matrix)
+        if len(self._derived_quantities) > rank:
+            indep_qts_indexes = pivots
         else:
             indep_qts_indexes = tuple(range(len(self._derived_quantities)))
 
@@ -347,7 +350,8 @@ class DimensionalGroup(HomogeneousGroup, IndependentGroup):
 
     def _validate_dimensional_group(self):
         check1 = len(self._scaling_quantities) == self._rank
-        check2 = self._scaling_matrix.rank() == self._rank
+        scaling_rank, _ = _matrix_rank_and_pivots(self._scaling_matrix.tolist())
+        check2 = scaling_rank == self._rank
         if not check1 or not check2:
             raise ValueError(
                 f"The group must have {self._rank} "
@@ -397,16 +401,6 @@ class DimensionalGroup(HomogeneousGroup, IndependentGroup):
         quantities = ', '.join(
             printer._print(qty._unreduced) for qty in self._original_quantities
         )
-
-        if self._is_dimensionless:
-            dimensions = ''
-        else:
-            dims = []
-            for dim_name, dim_exp in self._dimensions.items():
-                dim_exp_ = _unsympify_number(dim_exp)
-                if isinstance(dim_exp_, str):
-                    dim_exp_ = f"'{dim_exp_}'"
-                dims.append(f'{dim_name}={dim_exp_}')
-            dimensions = f", {', '.join(dims)}"
+        dimensions = self._get_dimensions_repr()
 
         return f'{class_name}({quantities}{dimensions})'
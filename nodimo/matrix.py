@@ -14,8 +14,9 @@ DimensionalMatrix
     Creates a dimensional matrix from a group of quantities.
 """
 
-from sympy import Symbol, ImmutableDenseMatrix, Matrix, S
+from sympy import Symbol, ImmutableDenseMatrix, S
 from sympy.printing.pretty.stringpict import prettyForm
+from typing import Optional
 
 from nodimo.quantity import Quantity
 from nodimo.groups import Group
@@ -71,6 +72,7 @@ class DimensionalMatrix(Group):
 
     def __init__(self, *quantities: Quantity):
         super().__init__(*quantities)
+        self._labeled_matrix: Optional[ImmutableDenseMatrix] = None
         self._set_dimensional_matrix()
 
     @property
@@ -85,6 +87,15 @@ class DimensionalMatrix(Group):
     def independent_rows(self) -> tuple[int]:
         return self._independent_rows
 
+    @property
+    def _symbolic(self) -> ImmutableDenseMatrix:
+        """Labeled matrix, built on first access."""
+
+        if self._labeled_matrix is None:
+            self._set_symbolic_dimensional_matrix()
+
+        return self._labeled_matrix
+
     def set_dimensions_order(self, *dimensions_names: str):
         """Sets the dimensions column order.
 
@@ -100,22 +111,20 @@ class DimensionalMatrix(Group):
 
         self._set_dimensions(**dimensions)
         self._set_matrix()
-        self._set_symbolic_dimensional_matrix()
+        self._labeled_matrix = None
 
     def _set_dimensional_matrix(self):
+        # The rank is set along with the independent rows.
         self._set_matrix()
-        self._set_matrix_rank()
         self._set_matrix_independent_rows()
-        self._set_symbolic_dimensional_matrix()
 
     def _set_symbolic_dimensional_matrix(self):
-        labeled_matrix = self._matrix.as_mutable()
-        dimensions_column = Matrix(list(self._dimensions))
-        quantities_row = Matrix([[Symbol('')] + list(self._quantities)])
-        labeled_matrix = labeled_matrix.col_insert(0, dimensions_column)
-        labeled_matrix = labeled_matrix.row_insert(0, quantities_row)
+        quantities_row = [Symbol('')] + list(self._quantities)
+        dimensions_rows = [
+            [Symbol(dim), *row] for dim, row in zip(self._dimensions, self._raw_matrix)
+        ]
 
-        self._symbolic = labeled_matrix.as_immutable()
+        self._labeled_matrix = ImmutableDenseMatrix([quantities_row] + dimensions_rows)
 
     def _sympy_(self):
         return self._matrix
@@ -126,20 +135,33 @@ class DimensionalMatrix(Group):
 
         return f'{class_name}({quantities})'
 
+    def _print_cells(self, printer) -> dict:
+        """Prints the labels and elements of the labeled matrix.
+
+        Each quantity and dimension's name is printed only once.
+
+        Returns
+        -------
+        raw_dmatrix : dict[tuple[int, int], Any]
+            Printed cells indexed by (row, column).
+        """
+
+        raw_dmatrix = {(0, 0): printer._print('')}
+        for j, qty in enumerate(self._quantities, start=1):
+            raw_dmatrix[0, j] = printer._print(qty)
+        for i, (dim, exponents) in enumerate(
+            zip(self._dimensions, self._raw_matrix), start=1
+        ):
+            raw_dmatrix[i, 0] = printer._print(dim)
+            for j, exp in enumerate(exponents, start=1):
+                raw_dmatrix[i, j] = printer._print(exp)
+
+        return raw_dmatrix
+
     def _sympystr(self, printer) -> str:
         nrows = len(self._dimensions) + 1
         ncols = len(self._quantities) + 1
-        raw_dmatrix = {}
-        for i in range(nrows):
-            for j in range(ncols):
-                if i == j == 0:
-                    raw_dmatrix[i, j] = printer._print('')
-                elif i == 0:
-                    raw_dmatrix[i, j] = printer._print(self._quantities[j - 1])
-                elif j == 0:
-                    raw_dmatrix[i, j] = printer._print(list(self._dimensions)[i - 1])
-                else:
-                    raw_dmatrix[i, j] = printer._print(self._matrix[i - 1, j - 1])
+        raw_dmatrix = self._print_cells(printer)
 
         maxwidth = []
         for j in range(ncols):
@@ -160,37 +182,32 @@ class DimensionalMatrix(Group):
         return dmatrix
 
     def _latex(self, printer) -> str:
-        dmatrix = R'\begin{array}'
-        dmatrix += '{r|' + 'r' * len(self._quantities) + '} & '
-        dmatrix += ' & '.join([printer._print(qty) for qty in self._quantities])
-        dmatrix += R' \\ \hline '
+        dmatrix = [R'\begin{array}', '{r|', 'r' * len(self._quantities), '} & ']
+        dmatrix.append(' & '.join(printer._print(qty) for qty in self._quantities))
+        dmatrix.append(R' \\ \hline ')
+        # Nonnegative exponents mimic the minus sign to preserve column
+        # width. The prefix is selected by indexing with (exp < 0).
+        prefixes = (R'\phantom{-}', '')
+        # Exponents repeat a lot, so each one is printed, along with its
+        # prefix, only once.
+        printed_exponents = {}
         for dim, exponents in zip(self._dimensions, self._raw_matrix):
             row = [f'\\mathsf{{{dim}}}']
             for exp in exponents:
-                if exp < 0:
-                    row.append(printer._print(exp))
-                else:
-                    # Mimic the minus sign to preserve column width.
-                    row.append(R'\phantom{-}' + printer._print(exp))
-            dmatrix += ' & '.join(row) + R' \\ '
-        dmatrix += R'\end{array}'
+                if exp not in printed_exponents:
+                    prefix = prefixes[bool(exp < 0)]
+                    printed_exponents[exp] = prefix + printer._print(exp)
+                row.append(printed_exponents[exp])
+            dmatrix.append(' & '.join(row))
+            dmatrix.append(R' \\ ')
+        dmatrix.append(R'\end{array}')
 
-        return dmatrix
+        return ''.join(dmatrix)
 
     def _pretty(self, printer) -> prettyForm:
         nrows = len(self._dimensions) + 1
         ncols = len(self._quantities) + 1
-        raw_dmatrix = {}
-        for i in range(nrows):
-            for j in range(ncols):
-                if i == j == 0:
-                    raw_dmatrix[i, j] = printer._print('')
-                elif i == 0:
-                    raw_dmatrix[i, j] = printer._print(self._quantities[j - 1])
-                elif j == 0:
-                    raw_dmatrix[i, j] = printer._print(list(self._dimensions)[i - 1])
-                else:
-                    raw_dmatrix[i, j] = printer._print(self._matrix[i - 1, j - 1])
+        raw_dmatrix = self._print_cells(printer)
 
         maxwidth = []
         for j in range(ncols):
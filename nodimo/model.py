@@ -20,7 +20,7 @@ from itertools import combinations
 from nodimo.quantity import Quantity
 from nodimo.groups import DimensionalGroup, ScalingGroup
 from nodimo.relation import Relation
-from nodimo._internal import _print_horizontal_line, _unsympify_number
+from nodimo._internal import _print_horizontal_line
 
 
 class Model(Relation):
@@ -167,16 +167,6 @@ class Model(Relation):
     def _sympyrepr(self, printer) -> str:
         class_name = type(self).__name__
         quantities = ', '.join(printer._print(qty) for qty in self._quantities)
-
-        if self._is_dimensionless:
-            dimensions = ''
-        else:
-            dims = []
-            for dim_name, dim_exp in self._dimensions.items():
-                dim_exp_ = _unsympify_number(dim_exp)
-                if isinstance(dim_exp_, str):
-                    dim_exp_ = f"'{dim_exp_}'"
-                dims.append(f'{dim_name}={dim_exp_}')
-            dimensions = f", {', '.join(dims)}"
+        dimensions = self._get_dimensions_repr()
 
         return f'{class_name}({quantities}{dimensions})'
@@ -14,7 +14,7 @@ Product
     Creates the product of quantities.
 """
 
-from sympy import srepr, Mul, S
+from sympy import srepr, Mul, S, Number
 from sympy.printing.pretty.stringpict import prettyForm
 
 from nodimo.quantity import Quantity, Constant, One
@@ -99,9 +99,18 @@ class Product(Quantity):
     ):
         self._preset_product(*factors, reduce=reduce)
 
-        product_dimension = self._factors[0].dimension
-        for qty in self._factors[1:]:
-            product_dimension *= qty.dimension
+        # Exponents are accumulated in a single pass, dropping the ones
+        # that cancel out, as the successive product of the factors'
+        # dimensions would do.
+        product_dimension: dict[str, Number] = {}
+        for qty in self._factors:
+            for dim, exp in qty.dimension.items():
+                if dim in product_dimension:
+                    product_dimension[dim] += exp
+                    if product_dimension[dim] == 0:
+                        del product_dimension[dim]
+                else:
+                    product_dimension[dim] = exp
 
         dummy_name = 'Product' if name == '' else name
         super().__init__(
@@ -154,6 +163,7 @@ class Product(Quantity):
             self._factors = list(factors)
 
     def _set_product(self, reduce: bool = True):
+        reduced_factors = None
         if bool(reduce):
             self._is_reduced = True
         elif any(not qty._is_reduced for qty in self._factors):
@@ -169,7 +179,7 @@ class Product(Quantity):
             self._is_constant = True
             self._is_number = all(qty._is_number for qty in self._factors)
         else:
-            if 'reduced_quantities' not in locals():
+            if reduced_factors is None:
                 reduced_factors = self._simplify_factors(*self._factors)
             self._is_constant = all(qty._is_constant for qty in reduced_factors)
             self._is_number = all(qty._is_number for qty in reduced_factors)
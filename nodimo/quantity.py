@@ -106,6 +106,7 @@ class Quantity:
     ):
         self._name: str
         self._dimension: Dimension = Dimension(**dimensions)
+        self._dimension_items: frozenset = frozenset(self._dimension.items())
         self._is_dimensionless: bool = self._dimension._is_dimensionless
         self._is_dependent: bool = bool(dependent)
         self._is_scaling: bool = bool(scaling)
@@ -199,7 +200,7 @@ class Quantity:
             return reduced_product
 
     def _key(self) -> tuple:
-        return (self._name, frozenset(self._dimension.items()))
+        return (self._name, self._dimension_items)
 
     def __hash__(self) -> int:
         return hash(self._key())
@@ -83,9 +83,7 @@ class Relation(HomogeneousGroup, IndependentGroup):
 
     def _sympyrepr(self, printer) -> str:
         class_name = type(self).__name__
-        quantities = ', '.join(
-            printer._print(qty._unreduced) for qty in self._quantities
-        )
+        quantities = self._get_quantities_repr()
         name = f", name='{self._name}'" if self._name != 'f' else ''
 
         return f'{class_name}({quantities}{name})'
@@ -110,6 +110,19 @@ def test_clear_null_dimensions():
     assert col._dimensions == dict(A=1, B=2)
 
 
+def test_dimensions_repr():
+    a = Quantity('a', A=1, B=0, C=9, scaling=True)
+    b = Quantity('b', A=-1, B=10, C=7, dependent=True)
+    c = Quantity('c', A=2, B=5, C=-6)
+    col = Collection(a,b,c)
+    col._set_dimensions(A=1, B=2)
+
+    assert col._get_dimensions_repr() == ', A=1, B=2, C=0'
+    col._clear_null_dimensions()
+    assert col._get_dimensions_repr() == ', A=1, B=2'
+    assert Collection(Quantity('d'))._get_dimensions_repr() == ''
+
+
 def test_constants():
     a = Quantity('a', A=1, B=0, C=9, scaling=True)
     b = Quantity('b', A=-1, B=10, C=7, dependent=True)
@@ -208,10 +221,7 @@ def test_submatrices():
     col2._set_submatrices()
 
     assert col1._submatrices == {}
-    assert col2._submatrices[a] == ImmutableDenseMatrix([-1, 10, 7, 16])
-    assert col2._submatrices[b] == ImmutableDenseMatrix([1, 0, 9, 10])
-    assert col2._submatrices[c] == ImmutableDenseMatrix([2, 3, 3, 8])
-    assert col2._submatrices[d] == ImmutableDenseMatrix([0, 4, -3, 2])
+    assert col2._submatrices == {a: 0, b: 1, c: 2, d: 3}
 
 
 def test_submatrix():
@@ -229,6 +239,7 @@ def test_submatrix():
                                                               [10,  3,  4],
                                                               [ 7,  3, -3],
                                                               [16, 8,  2]])
+    assert col._get_submatrix(a,b,c,d) is col._matrix
     with raises(ValueError):
         col._get_submatrix(a,b,15)
 
@@ -262,6 +273,10 @@ def test_equality():
     assert not col1 == col4
     assert col1 != [a,b,c,d]
 
+    col4._clear_constants()
+
+    assert col1 == col4
+
 
 def test_contains_and_length():
     a = Quantity('a', A=-1, B=10, C=7, D=16, scaling=True)
@@ -274,6 +289,8 @@ def test_contains_and_length():
     assert a in col
     assert c in col
     assert e in col
+    assert Quantity('f') not in col
+    assert 'a' not in col
     assert len(col) == 5
 
 
@@ -27,6 +27,7 @@ def test_dimensions():
     dm.set_dimensions_order('B', 'C', 'A')
 
     assert tuple(dm._dimensions.keys()) == ('B', 'C', 'A')
+    assert list(dm._symbolic.col(0))[1:] == [Symbol('B'), Symbol('C'), Symbol('A')]
 
     dm.set_dimensions_order('C')
 
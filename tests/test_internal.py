@@ -1,10 +1,10 @@
 from pytest import raises
-from sympy import Symbol, Number, S
+from sympy import Symbol, Number, S, Matrix
 from warnings import catch_warnings
 from nodimo._internal import (
     _is_running_on_jupyter, _show_object, _print_horizontal_line, _sympify_number,
     _unsympify_number, _prettify_name, NodimoWarning, _nodimo_formatwarning,
-    _show_nodimo_warning
+    _show_nodimo_warning, _matrix_rank_and_pivots, _matrix_rref
 )
 
 
@@ -59,6 +59,32 @@ def test_prettify_name():
         _prettify_name('1', bold=True)
 
 
+def test_matrix_rank_and_pivots():
+    m1 = [[-1, 1, 2, 0], [10, 0, 3, 4], [7, 9, 3, -3], [16, 10, 8, 1]]
+    m2 = [[0, 2, 4], [0, 1, 2], [Number(1,2), 0, 3]]
+    m3 = [[1, 2], [S.Pi, 2*S.Pi]]
+
+    assert _matrix_rank_and_pivots([]) == (0, ())
+    assert _matrix_rank_and_pivots([[0, 0], [0, 0]]) == (0, ())
+    assert _matrix_rank_and_pivots(m1) == (3, (0, 1, 2))
+    assert _matrix_rank_and_pivots(m2) == (2, (0, 1))
+    assert _matrix_rank_and_pivots(m3) == (1, (0,))
+
+    for m in (m1, m2, m3):
+        mt = Matrix(m).T.tolist()
+        assert _matrix_rank_and_pivots(mt) == (Matrix(mt).rank(), Matrix(mt).rref()[1])
+
+
+def test_matrix_rref():
+    m1 = Matrix([[-1, 1, 2, 0], [10, 0, 3, 4], [7, 9, 3, -3], [16, 10, 8, 1]])
+    m2 = Matrix([[0, 2, 4], [0, 1, 2], [Number(1,2), 0, 3]])
+    m3 = Matrix([[1, 2], [S.Pi, 2*S.Pi]])
+
+    for m in (m1, m2, m3, m1.T, m2.T, m3.T):
+        rref, pivots = m.rref()
+        assert _matrix_rref(m) == (rref, pivots)
+
+
 def test_nodimo_formatwarning():
     message = _nodimo_formatwarning('nodimo warning message', NodimoWarning, None, None)
     assert message == '\033[93mNodimoWarning\033[0m: nodimo warning message\n' 